@@ -84,3 +84,8 @@ if __name__ == "__main__":
     pprint(saved_data)
     from_test_table = sl_data.query_db('Shares')
     pprint(from_test_table)
+
+    # Per-instrument summary counted by database (one row for each):
+    summary = sl_data.aggregate_db("CorporateBonds",
+                                   "2020-08-01", "2020-09-09")
+    pprint(summary)
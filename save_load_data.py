@@ -9,6 +9,8 @@ class SLDataMYSQL:
     Methods:
         write_to_mysql: insert selected data to MYSQL db.
         query_db: select from MYSQL db.
+        aggregate_db: per-instrument summary over a date range,
+                      calculated in MYSQL db.
     """
 
     def __init__(self, address: str, db_name: str,
@@ -111,3 +113,77 @@ class SLDataMYSQL:
             return result_set
         except sqlalchemy.exc.SQLAlchemyError as dbe2:
             print("Error while reading from db:", dbe2)
+
+    def aggregate_db(self, table_name: str, date_from: str,
+                     date_to: str) -> list:
+        """ Select per-instrument summary from DB (GROUP BY secid).
+
+        The same numbers EDA calculates in pandas, but counted by
+        MYSQL, so only one row per instrument is transferred.
+
+        Input:
+            table_name (str): table from MYSQL database to aggregate.
+            date_from (str): first trade date, e.g. "2020-08-01".
+            date_to (str): last trade date, e.g. "2020-09-09".
+
+        Return:
+            list: rows with secid, short_name, avg_trade_value,
+                  avg_num_trades, avg_vol_pct, low_liq_days,
+                  medium_liq_days, high_liq_days, last_close and
+                  days_to_expire (bond tables only).
+        """
+
+        table = sql.Table(f'{table_name}', self.metadata,
+                          autoload=True,
+                          autoload_with=self.engine_mysql)
+        period = sql.and_(table.c.trade_date >= date_from,
+                          table.c.trade_date <= date_to)
+        # Same gap and liquidity bounds as in EDA.choose_share and
+        # EDA.liquidity:
+        gap_pct = sql.case(
+            [(table.c.close_price == 0, 0)],
+            else_=sql.func.abs(table.c.high_price - table.c.low_price) /
+            table.c.close_price * 100)
+        low_liq = sql.case([(table.c.trade_value < 1000000, 1)], else_=0)
+        medium_liq = sql.case(
+            [(sql.and_(table.c.trade_value >= 1000000,
+                       table.c.trade_value < 10000000), 1)], else_=0)
+        high_liq = sql.case([(table.c.trade_value >= 10000000, 1)],
+                            else_=0)
+        try:
+            last_day = sql.select(
+                [table.c.secid,
+                 sql.func.max(table.c.trade_date).label("last_date")]). \
+                where(period).group_by(table.c.secid).alias("last_day")
+            last_close = sql.select(
+                [table.c.secid,
+                 sql.func.max(table.c.close_price).label("close_price")]). \
+                select_from(table.join(
+                    last_day,
+                    sql.and_(table.c.secid == last_day.c.secid,
+                             table.c.trade_date == last_day.c.last_date))). \
+                group_by(table.c.secid).alias("last_close")
+            columns = [
+                table.c.secid,
+                sql.func.max(table.c.short_name).label("short_name"),
+                sql.func.avg(table.c.trade_value).label("avg_trade_value"),
+                sql.func.avg(table.c.num_trades).label("avg_num_trades"),
+                sql.func.round(sql.func.avg(gap_pct), 2).label(
+                    "avg_vol_pct"),
+                sql.func.sum(low_liq).label("low_liq_days"),
+                sql.func.sum(medium_liq).label("medium_liq_days"),
+                sql.func.sum(high_liq).label("high_liq_days"),
+                sql.func.max(last_close.c.close_price).label("last_close")]
+            if "expire_date" in table.c:
+                columns.append(sql.func.datediff(
+                    sql.func.max(table.c.expire_date),
+                    date_to).label("days_to_expire"))
+            query = sql.select(columns). \
+                select_from(table.join(
+                    last_close, table.c.secid == last_close.c.secid)). \
+                where(period).group_by(table.c.secid)
+            result_get = self.connection.execute(query)
+            result_set = result_get.fetchall()
+            return result_set
+        except sqlalchemy.exc.SQLAlchemyError as dbe3:
+            print("Error while aggregating in db:", dbe3)